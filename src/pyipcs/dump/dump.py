@@ -200,8 +200,11 @@ class Dump:
         # Initialize Setup
         # =========================
 
-        # Set DDIR
-        session.ddir.use(self.ddir)
+        # Set DDIR. A temporary DDIR was just created so skip the existence check
+        if use_cur_ddir or ddir:
+            session.ddir.use(self.ddir)
+        else:
+            session.ddir._use(self.ddir)
 
         # Set default DSNAME
         session.ddir.defaults(dsname=self.dsname)
@@ -64,8 +64,10 @@ class ListSliptrap(Subcmd):
 
         # Parse LIST storage to get sliptrap
         # SLIPTRAP text is between '| ' and ' |'
-        self.data["sliptrap"] = ""
-        for sliptrap_line in sliptrap_lines:
-            self.data["sliptrap"] += sliptrap_line[
+        # Line pieces are joined once
+        self.data["sliptrap"] = "".join(
+            sliptrap_line[
                 sliptrap_line.find("| ") + len("| ") : len(sliptrap_line) - len(" |")
             ]
+            for sliptrap_line in sliptrap_lines
+        )
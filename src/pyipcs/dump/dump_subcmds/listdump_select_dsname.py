@@ -4,12 +4,19 @@ LISTDUMP with parameters SELECT and DSNAME Custom Subcmd Object
 
 from __future__ import annotations
 from typing import TYPE_CHECKING
+import re
 from ...hex_obj import Hex
 from ...subcmd import Subcmd
 
 if TYPE_CHECKING:
     from ...session import IpcsSession
 
+# Storage area summary line. Captures the number of bytes described in hex
+_STORAGE_SUMMARY_REGEX = re.compile(r"^.*?X'([^']*)' bytes described in.*$", re.M)
+# ASID of a storage area summary line
+_ASID_REGEX = re.compile(r"ASID\(X'([^']*)'\)")
+# Dataspace name of a storage area summary line
+_DSPNAME_REGEX = re.compile(r"DSPNAME\(([^)]*)\)")
 
 class ListdumpSelectDsname(Subcmd):
     """
@@ -75,70 +82,50 @@ class ListdumpSelectDsname(Subcmd):
 
         self.data["storage_areas"] = []
 
+        # Storage area dictionaries in data indexed by ASID
+        areas_by_asid = {}
+
         # =================================================================
         # Get data about storage areas from various summaries in LISTDUMP
         # =================================================================
 
-        # Every storage area is summarized by 'bytes described in
-        storage_summary_index = self.find("bytes described in")
-
-        # While there are summaries to add to storage_areas
-        while storage_summary_index != -1:
+        # Every storage area is summarized by 'bytes described in'
+        # Summary lines are found in a single pass over the output
+        for storage_summary in _STORAGE_SUMMARY_REGEX.finditer(self.output):
 
-            # Get full summary line
-            storage_summary_line = self[
-                self.rfind("\n", 0, storage_summary_index)
-                + 1 : self.find("\n", storage_summary_index)
-            ]
+            storage_summary_line = storage_summary.group(0)
 
             # If this summarizes some ASID
-            if "ASID" in storage_summary_line:
-
-                # Get bytes described
-                bytes_described = Hex(
-                    storage_summary_line[
-                        storage_summary_line.find("X'")
-                        + len("X'") : storage_summary_line.find("' bytes described in")
-                    ].replace("_", "")
-                )
-
-                # Get ASID
-                asid_start = storage_summary_line.find("ASID(X'") + len("ASID(X'")
-                asid_end = storage_summary_line.find("')", asid_start)
-                asid = Hex(storage_summary_line[asid_start:asid_end].replace("_", ""))
-
-                # Add standard ASID dictionary if it is not in data
-                if not any(area["asid"] == asid for area in self.data["storage_areas"]):
-                    self.data["storage_areas"].append({
-                        "asid": asid,
-                        "total_bytes": None,
-                        "sumdump": Hex("0"),
-                        "dataspaces": {},
-                    })
-
-                for area in self.data["storage_areas"]:
-                    if area["asid"] == asid:
-                        # Get DSPNAME if it is included
-                        if "DSPNAME" in storage_summary_line:
-                            dspname_start = storage_summary_line.find("DSPNAME(") + len(
-                                "DSPNAME("
-                            )
-                            dspname_end = storage_summary_line.find(")", dspname_start)
-                            dspname = storage_summary_line[dspname_start:dspname_end].replace(
-                                "_", ""
-                            )
-                            area["dataspaces"][
-                                dspname
-                            ] = bytes_described
-                        # If this is SUMMARY DUMP bytes
-                        elif "SUMDUMP" in storage_summary_line:
-                            area["sumdump"] = bytes_described
-                        # Else just regular ASID total_bytes
-                        else:
-                            area["total_bytes"] = bytes_described
-                        break
-
-            # Repeat find and loop
-            storage_summary_index = self.find(
-                "bytes described in", storage_summary_index + 1
-            )
+            asid_match = _ASID_REGEX.search(storage_summary_line)
+            if asid_match is None:
+                continue
+
+            # Get bytes described
+            bytes_described = Hex(storage_summary.group(1).replace("_", ""))
+
+            # Get ASID
+            asid = Hex(asid_match.group(1).replace("_", ""))
+
+            # Add standard ASID dictionary if it is not in data
+            area = areas_by_asid.get(asid)
+            if area is None:
+                area = {
+                    "asid": asid,
+                    "total_bytes": None,
+                    "sumdump": Hex("0"),
+                    "dataspaces": {},
+                }
+                self.data["storage_areas"].append(area)
+                areas_by_asid[asid] = area
+
+            # Get DSPNAME if it is included
+            dspname_match = _DSPNAME_REGEX.search(storage_summary_line)
+            if dspname_match is not None:
+                dspname = dspname_match.group(1).replace("_", "")
+                area["dataspaces"][dspname] = bytes_described
+            # If this is SUMMARY DUMP bytes
+            elif "SUMDUMP" in storage_summary_line:
+                area["sumdump"] = bytes_described
+            # Else just regular ASID total_bytes
+            else:
+                area["total_bytes"] = bytes_described
@@ -3,7 +3,6 @@ IpcsAllocations Object
 """
 
 
-import copy
 from ..error_handling import ArgumentTypeError
 
 class IpcsAllocations:
@@ -53,9 +52,14 @@ class IpcsAllocations:
         -------
         None    
         """
+        if not isinstance(init_allocations, dict):
+            raise ArgumentTypeError("init_allocations", init_allocations, dict)
+
         # Set Initial Allocations
+        # Allocations start empty so there is nothing to clear or extend
         self._allocations = {}
-        self.update(init_allocations)
+        for dd_name, specification in init_allocations.items():
+            self.set(dd_name, specification)
 
     def get(self) -> dict[str, str | list[str]]:
         """
@@ -67,7 +71,11 @@ class IpcsAllocations:
             Returns dictionary of all allocations where keys are DD names
             and values are string data set allocation requests or lists of cataloged datasets.
         """
-        return copy.deepcopy(self._allocations)
+        # Strings are immutable and lists only hold strings, so copying each list is enough
+        return {
+            dd_name: specification.copy() if isinstance(specification, list) else specification
+            for dd_name, specification in self._allocations.items()
+        }
 
     def set(self, dd_name: str, specification: str | list[str], extend: bool = False) -> None:
         """
@@ -104,8 +112,9 @@ class IpcsAllocations:
         if dd_name == "SYSEXEC" and not isinstance(specification, list):
             raise TypeError("DD name 'SYSEXEC' specification must be of type list[str]")
 
-        dd_name = copy.deepcopy(dd_name)
-        specification = copy.deepcopy(specification)
+        # Strings are immutable and lists only hold strings, so a shallow copy is enough
+        if isinstance(specification, list):
+            specification = specification.copy()
         if extend and dd_name in self._allocations:
             # Check both specification and new specification are of type list[str]
             if not isinstance(self._allocations[dd_name], list):
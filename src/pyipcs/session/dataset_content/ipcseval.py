@@ -3,13 +3,36 @@ REXX to run Evaluate
 """
 
 # REXX to run evaluate
+# Arguments are one or more "hex_address dec_position dec_length" triples
+# Data for each triple is returned in order, each prefixed with ':'
 IPCSEVAL = """/* REXX */
+Numeric digits(20)           /* Enough digits for 64-bit
+                                addresses, set once for every
+                                call to Obtain_Data             */
+ipcs_eval_limit = 512        /* The maximum number of bytes that
+                                the IPCS EVALUATE subcommand can
+                                access per invocation           */
 storage. = ''
+cache_block. = ''            /* Ring of cached block numbers    */
+cache_next = 1               /* Next ring slot to replace       */
+cache_limit = 64             /* Maximum number of cached blocks */
+recent_block = ''            /* Most recently used cached block */
+recent_val = ''              /* Data for the most recent block  */
 ADDRESS IPCS
  
+   arg ARGUMENTS
+   do while ARGUMENTS <> ''  /* For each requested triple       */
+     parse var ARGUMENTS hex_address dec_position dec_length ARGUMENTS
+     if Obtain_Data(hex_address,dec_position,dec_length) <> 0 then do
+       call Access_Error     /* Display the error message       */
+       exit 16
+     end
+     "NOTE ':"data"'"        /* Return the requested data       */
+   end
+   exit 0
  
- 
-/* Obtain_Data: procedure expose storage. */
+Obtain_Data: procedure expose storage. cache_block. cache_next cache_limit,
+                              recent_block recent_val ipcs_eval_limit data
    /*-----------------------------------------------------------*/
    /* Function:  Obtain_Data                                    */
    /*                                                           */
@@ -17,7 +40,8 @@ ADDRESS IPCS
    /*            EVALUATE subcommand as necessary to access     */
    /*            512-byte blocks of data from the IPCS dump     */
    /*            source and store the data in variable          */
-   /*            "storage."  Callers of Obtain_Data must        */
+   /*            "storage." keyed by block number.              */
+   /*            Callers of Obtain_Data must                    */
    /*            request storage from the same address space.   */
    /*                                                           */
    /* Input:     Description of data to access:                 */
@@ -27,85 +51,137 @@ ADDRESS IPCS
    /*             first byte to access.                         */
    /*            Decimal length of the data to access.          */
    /*                                                           */
-   /* Output:    Requested data is returned.                    */
+   /* Output:    Requested data is returned in variable "data". */
+   /*            Returns 0 if the data was accessed, otherwise  */
+   /*            returns 16.                                    */
    /*-----------------------------------------------------------*/
  
-   arg ARGUMENTS
-   PARSE UPPER ARG hex_address dec_position dec_length 
+   PARSE ARG hex_address, dec_position, dec_length
+   if dec_length = 0 then do /* Nothing to access               */
+     data = ''
+     return 0
+   end
 
 /* trace off           Suppress display of unsuccessful storage */
 /*                              fetches once PF3 has been hit   */
-   Numeric digits(10)
-   ipcs_eval_limit = 512     /* The maximum number of bytes that
-                                the IPCS EVALUATE subcommand can
-                                access per invocation           */
-   page_size = 4096          /* The size of a storage page      */
-   first_index  = dec_position % ipcs_eval_limit /* Determine the
-                                first 512 byte increment        */
-   last_index  = (dec_position+dec_length) % ipcs_eval_limit /*
+   hex_address = strip(space(translate(hex_address,' ','_'),0),'T','.')
+                             /* Remove '_' separators and a
+                                trailing '.' that IPCS accepts
+                                but x2d does not                */
+   first_address = x2d(hex_address)+dec_position /* Determine the
+                                address of the first byte       */
+   end_address = first_address+dec_length /* Determine the
+                                address after the last byte     */
+   first_block  = first_address % ipcs_eval_limit /* Determine the
+                                first 512 byte block            */
+   last_block  = (end_address-1) % ipcs_eval_limit /*
                                 Determine the last 512 byte
-                                increment                       */
+                                block.  The last byte read is
+                                one before the end address so a
+                                read ending on a 512 byte
+                                boundary does not access the
+                                next block                      */
+   block_address = first_block*ipcs_eval_limit /* Address of
+                                the current block, advanced by
+                                one block per iteration         */
+   return_offset = (first_address-block_address)*2+1
+   return_length = dec_length*2
    buffer = ''
-   do i= first_index to last_index /* For each 512 increment    */
-    if storage.hex_address.i = '' then do
+   do block = first_block to last_block /* For each 512 block   */
+    if block = recent_block then
+ 
+    /*----------------------------------------------------------*/
+    /* Reuse the most recently used block without looking it   */
+    /* up in "storage."                                         */
+    /*----------------------------------------------------------*/
+ 
+      piece = recent_val
+    else if storage.block <> '' then do
+      piece = storage.block
+      recent_block = block
+      recent_val = piece
+    end
+    else do
  
     /*----------------------------------------------------------*/
     /* If the data has not yet been accessed, access it.        */
+    /* Blocks are aligned on 512 byte boundaries so a block     */
+    /* never spans across a page and is shared by every         */
+    /* address that resolves into it.                           */
     /*----------------------------------------------------------*/
  
-         hex_address_dot = ,
-            hex_address||.    /* Indicate for IPCS that it is an
-                                address                         */
-        "EVALUATE"   hex_address_dot ,
-                "POSITION("i*ipcs_eval_limit")" ,
+        "EVALUATE"   d2x(block_address)||. ,
+                "POSITION(0)" ,
                 "LENGTH("ipcs_eval_limit")" ,
                 "REXX(STORAGE(X))" /* Access the data by invoking
                                 the IPCS EVALUATE subcommand    */
-        if rc > 0 then do
+        if rc = 0 then do
+ 
+        /*------------------------------------------------------*/
+        /* Save the data in a variable so that it only needs to */
+        /* be accessed once.  The cache is a ring of            */
+        /* "cache_limit" blocks, the oldest block is released   */
+        /* when it is full.                                     */
+        /*------------------------------------------------------*/
+ 
+          evicted_block = cache_block.cache_next
+          if evicted_block <> '' then storage.evicted_block = ''
+          cache_block.cache_next = block
+          cache_next = cache_next // cache_limit + 1
+          storage.block = x
+          piece = x
+          recent_block = block
+          recent_val = piece
+        end
+        else do
  
         /*------------------------------------------------------*/
-        /* If 512 bytes of data could not be accessed, determine*/
-        /* if the data spans across a page.  If it does, attempt*/
-        /* to access the data that resides in the first page.   */
+        /* If the whole block could not be accessed, attempt to */
+        /* access only the requested data within the block.     */
+        /* Pad the front of the data so offsets still line up   */
+        /* with the start of the block.                         */
         /*------------------------------------------------------*/
  
-          address = x2d(hex_address)+i*ipcs_eval_limit
-          new_length=page_size-(address//page_size)
-          if new_length=0 | new_length >= ipcs_eval_limit then
-            signal Access_Error
-          "EVALUATE"   hex_address_dot ,
-                  "POSITION("i*ipcs_eval_limit")" ,
-                  "LENGTH("new_length")" ,
+          part_start = max(first_address,block_address)
+          part_end = min(end_address,block_address+ipcs_eval_limit)
+          "EVALUATE"   d2x(part_start)||. ,
+                  "POSITION(0)" ,
+                  "LENGTH("part_end-part_start")" ,
                   "REXX(STORAGE(X))" /* Access the data by invoking
                                 the IPCS EVALUATE subcommand    */
-          if rc > 0 then signal Access_Error
+          if rc > 0 then return 16
+          piece = copies('00',part_start-block_address)||x
         end
-        storage.hex_address.i = x   /* Save the data in a
-                                variable so that it only needs to
-                                be accessed once                */
     end
-    buffer = buffer||storage.hex_address.i /* Augment the buffer
-                                with the current data           */
-   end                       /* For each 512 increment          */
-   return_offset = (dec_position-first_index*ipcs_eval_limit)*2+1
-   return_length = dec_length*2
-   if return_offset-1 + return_length > length(buffer) then
+    if block = first_block then
+ 
+    /*----------------------------------------------------------*/
+    /* Only keep the requested data from the first block.  A    */
+    /* single block holds all of the data when the first and    */
+    /* last blocks are the same.                                */
+    /*----------------------------------------------------------*/
+ 
+      buffer = substr(piece,return_offset)
+    else
+      buffer = buffer||piece /* Augment the buffer with the
+                                current data                    */
+    block_address = block_address+ipcs_eval_limit
+   end                       /* For each 512 block              */
+   if return_length > length(buffer) then
  
    /*-----------------------------------------------------------*/
    /* Do not attempt to return more than what is in the buffer. */
    /*-----------------------------------------------------------*/
  
-      signal Access_Error
-   string = substr(buffer,return_offset,return_length)
-   "NOTE '"string"'" /* Return
-                                the appropriate data from the
-                                buffer                          */
-   return
+      return 16
+   data = left(buffer,return_length) /* Return the appropriate
+                                data from the buffer            */
+   return 0
  
-Access_Error: nop
+Access_Error: procedure
 GEN$='IPCS Evaluate subcommand unable to access storage'
 Call Put                    /*       Display GEN$            */
-Exit 16
+return
  
 Put: procedure expose GEN$
 /*-----------------------------------------------------------*/
@@ -9,16 +9,8 @@ IPCS NOPARM                 /* ENTER THE IPCS SUBCOMMAND */
                             /* TO START AN IPCS SESSION */
 IF &LASTCC>8 THEN EXIT CODE(&MAXCC)
 
-WRITE ___IPCS_SUBCMD___
-WRITE &SUBCMD
-WRITE ___IPCS_SUBCMD___
-
 WRITE ___SUBCMD_START___
 &SUBCMD
 SET &RC = &LASTCC
-WRITE ___SUBCMD_END___
-
-WRITE ___SUBCMD_RC_START___
-WRITE &RC
-WRITE ___SUBCMD_RC_END___
+WRITE ___SUBCMD_END___ &RC
 """
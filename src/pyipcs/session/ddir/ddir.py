@@ -4,7 +4,7 @@ DumpDirectory Object
 
 from __future__ import annotations
 from typing import TYPE_CHECKING
-import random
+import re
 import copy
 from zoautil_py import datasets, exceptions
 from ...tso_shell import tsocmd
@@ -13,13 +13,21 @@ from ...error_handling import (
     SessionNotActiveError,
     ArgumentTypeError,
 )
-from ...util.zoautil_py_util import datasets_recall_exists
+from ...util.zoautil_py_util import datasets_recall_exists, unused_dataset_id
 from .setdef import SetDef
 from ...subcmd import Subcmd
 
 if TYPE_CHECKING:
     from ..session import IpcsSession
 
+# Template for a single BLSCDDIR keyword parameter (ex: "NDXCISZ(4096)")
+_PARAM_TMPL = "{}({})"
+
+# Sentinel for BLSCDDIR params lookup misses
+_MISSING = object()
+# Source dataset names in LISTDUMP output
+_LISTDUMP_DSNAME_REGEX = re.compile(r"DSNAME\('(.*?)'\)", re.S)
+
 
 class DumpDirectory:
     """
@@ -58,6 +66,8 @@ class DumpDirectory:
         Get/Set default values for certain parameters on IPCS subcommands for your IPCS session.
     """
 
+    __slots__ = ("_session", "_dsname", "_presets")
+
     # Dictionary of all possible DDIR presets from BLSCDDIR params and their types
     _BLSCDDIR_PARAMS = {
         "dataclas": str,
@@ -157,7 +167,7 @@ class DumpDirectory:
         """
 
         # BLSCDDIR standard TSO Command
-        blscddir_cmd = f"%BLSCDDIR DSNAME({dsname})"
+        blscddir_parts = ["%BLSCDDIR", _PARAM_TMPL.format("DSNAME", dsname)]
 
         # ===================================================================
         # Convert keyword args to BLSCDDIR params
@@ -168,19 +178,20 @@ class DumpDirectory:
 
         # Add parameters to BLSCDDIR command
         for param, value in params.items():
-            if param in self._BLSCDDIR_PARAMS:
-                if not isinstance(value, self._BLSCDDIR_PARAMS[param]):
-                    raise ArgumentTypeError(param, value, self._BLSCDDIR_PARAMS[param])
-                blscddir_cmd += f" {param}({value})"
+            expected_type = self._BLSCDDIR_PARAMS.get(param, _MISSING)
+            if expected_type is not _MISSING:
+                if not isinstance(value, expected_type):
+                    raise ArgumentTypeError(param, value, expected_type)
+                blscddir_parts.append(_PARAM_TMPL.format(param, value))
             elif param == "blscddir_params":
                 if not isinstance(value, str):
                     raise ArgumentTypeError(param, value, str)
-                blscddir_cmd += f" {value}"
+                blscddir_parts.append(value)
             else:
                 raise ValueError(f"Invalid DDIR preset {param}")
 
         # Run BLSCDDIR EXEC to create DDIR
-        tsocmd(blscddir_cmd, allocations=self._session.aloc.get())
+        tsocmd(" ".join(blscddir_parts), allocations=self._session.aloc.get())
 
 
     def create_tmp(self, **kwargs) -> str:
@@ -223,18 +234,14 @@ class DumpDirectory:
         if not self._session.active:
             raise SessionNotActiveError()
 
-        # Generate a DDIR with a DDIR id until one that does not exist is found
-        ddir_id = "".join(random.choices("0123456789", k=5))
+        # Generate a DDIR id that is not used by any existing session DDIR
+        ddir_id = unused_dataset_id(f"{self._session.hlq_full}.D")
         tmp_ddir = f"{self._session.hlq_full}.D{ddir_id}.DDIR"
-        while datasets_recall_exists(tmp_ddir):
-            ddir_id = "".join(random.choices("0123456789", k=5))
-            tmp_ddir = f"{self._session.hlq_full}.D{ddir_id}.DDIR"
 
         # Create the DDIR
         self.create(tmp_ddir, **kwargs)
 
         # Attempt to add DDIR to main session dataset for tracking
-        datasets_recall_exists(self._session.hlq_full)
         try:
             datasets.write(self._session.hlq_full, content=tmp_ddir, append=True)
         except exceptions.DatasetWriteException as e:
@@ -312,9 +319,10 @@ class DumpDirectory:
         """
         # Add to presets if keyword argument was added
         for param, value in kwargs.items():
-            if param in self._BLSCDDIR_PARAMS:
-                if not isinstance(value, self._BLSCDDIR_PARAMS[param]):
-                    raise ArgumentTypeError(param, value, self._BLSCDDIR_PARAMS[param])
+            expected_type = self._BLSCDDIR_PARAMS.get(param, _MISSING)
+            if expected_type is not _MISSING:
+                if not isinstance(value, expected_type):
+                    raise ArgumentTypeError(param, value, expected_type)
                 self._presets[param] = value
             elif param == "blscddir_params":
                 if not isinstance(value, str):
@@ -341,25 +349,17 @@ class DumpDirectory:
             in the current dump directory of your IPCS session.
         """
 
-        ddir_sources = []
-
         listdump = Subcmd(self._session, "LISTDUMP")
 
+        # Read the output once. Searches on a Subcmd saved to a file reopen the file each time
+        listdump_output = listdump.output
+
         if listdump.rc != 0:
             raise InvalidReturnCodeError(
-                listdump.subcmd, listdump.output, listdump.rc, 0
+                listdump.subcmd, listdump_output, listdump.rc, 0
             )
 
-        dsname_start = listdump.find("DSNAME('")
-        while dsname_start != -1:
-            dsname_start += len("DSNAME('")
-            dsname_end = listdump.find("')", start=dsname_start)
-
-            ddir_sources.append(listdump[dsname_start:dsname_end])
-
-            dsname_start = listdump.find("DSNAME('", start=dsname_end)
-
-        return ddir_sources
+        return _LISTDUMP_DSNAME_REGEX.findall(listdump_output)
 
     def defaults(self, **kwargs) -> SetDef:
         """
@@ -433,18 +433,60 @@ class DumpDirectory:
         """
         return self._dsname
 
-    def _delete(self, dsname: str) -> None:
+    def _has_source(self, dsname: str) -> bool:
+        """
+        Protected Function.
+
+        Check if `dsname` is a source in the current DDIR.
+        `LISTDUMP` is limited to `dsname` so the rest of the DDIR is not listed.
+        Always runs `LISTDUMP` since sources can be dropped outside of this session.
+
+        Returns
+        -------
+        bool
+        """
+        # LISTDUMP only describes the source when it is in the DDIR
+        # Return code 4 is a warning such as no source being described
+        listdump = Subcmd(self._session, f"LISTDUMP DSNAME('{dsname}')")
+        if listdump.rc not in (0, 4):
+            raise InvalidReturnCodeError(
+                listdump.subcmd, listdump.output, listdump.rc, 0
+            )
+        return listdump.find(f"DSNAME('{dsname}')") != -1
+
+    def _use(self, dsname: str) -> None:
+        """
+        Protected Function.
+
+        Use DDIR without checking that it exists.
+        Only for DDIRs that pyIPCS has just created.
+
+        Returns
+        -------
+        None
+        """
+        self._dsname = dsname
+
+    def _delete(self, dsname: str, check_exists: bool = True) -> None:
         """
         Protected Function.
 
         Delete DDIR.
 
+        Parameters
+        ----------
+        dsname : str
+
+        check_exists : bool, optional
+            If `False` the caller already knows the DDIR exists and the existence check is skipped.
+            Default is `True`.
+
         Returns
         -------
         None
         """
         # If DDIR still exists delete
-        if datasets_recall_exists(dsname):
+        if not check_exists or datasets_recall_exists(dsname):
             tsocmd(
                 f"DELETE '{dsname}'",
                 allocations={"IPCSALOC": dsname},
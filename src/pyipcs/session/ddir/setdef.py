@@ -12,6 +12,24 @@ from ...error_handling import ArgumentTypeError
 if TYPE_CHECKING:
     from .. import IpcsSession
 
+# Templates for SETDEF parameters
+_PARAM_TMPL = "{}({})"
+_HEX_PARAM_TMPL = "{}(X'{}')"
+_DSNAME_TMPL = "DSNAME('{}')"
+
+# All valid SETDEF keyword arguments
+_SETDEF_ARGS = frozenset((
+    "confirm",
+    "dsname",
+    "display",
+    "flag",
+    "length",
+    "pds",
+    "asid",
+    "dspname",
+    "setdef_params",
+))
+
 
 class SetDef(Subcmd):
     """
@@ -137,24 +155,14 @@ class SetDef(Subcmd):
         # Check kwargs contains correct keyword arguments
         # ===================================================
         for key in kwargs:
-            if key not in [
-                "confirm",
-                "dsname",
-                "display",
-                "flag",
-                "length",
-                "pds",
-                "asid",
-                "dspname",
-                "setdef_params",
-            ]:
+            if key not in _SETDEF_ARGS:
                 raise ValueError(f"Invalid SETDEF argument '{key}'")
 
         # =============================
         # Construct SETDEF Subcommand
         # =============================
 
-        setdef_subcmd = "SETDEF LIST"
+        setdef_parts = ["SETDEF LIST"]
 
         # =====================
         # CONFIRM NOCONFIRM
@@ -163,10 +171,7 @@ class SetDef(Subcmd):
         if "confirm" in kwargs:
             if not isinstance(kwargs["confirm"], bool):
                 raise ArgumentTypeError("confirm", kwargs["confirm"], bool)
-            if kwargs["confirm"]:
-                setdef_subcmd += " CONFIRM"
-            else:
-                setdef_subcmd += " NOCONFIRM"
+            setdef_parts.append("CONFIRM" if kwargs["confirm"] else "NOCONFIRM")
 
         # ======================
         # DSNAME/NODSNAME
@@ -176,9 +181,9 @@ class SetDef(Subcmd):
             if not isinstance(kwargs["dsname"], (str, type(None))):
                 raise ArgumentTypeError("dsname", kwargs["dsname"], (str, None))
             if kwargs["dsname"] is None:
-                setdef_subcmd += " NODSNAME"
+                setdef_parts.append("NODSNAME")
             else:
-                setdef_subcmd += f" DSNAME('{kwargs['dsname']}')"
+                setdef_parts.append(_DSNAME_TMPL.format(kwargs["dsname"]))
 
         # ======================
         # DISPLAY
@@ -205,7 +210,7 @@ class SetDef(Subcmd):
                 )
             # If not empty list
             if kwargs["display"]:
-                setdef_subcmd += f" DISPLAY({' '.join(kwargs['display'])})"
+                setdef_parts.append(_PARAM_TMPL.format("DISPLAY", " ".join(kwargs["display"])))
 
         # ======================
         # FLAG
@@ -227,7 +232,7 @@ class SetDef(Subcmd):
                     + " Valid parameters are:"
                     + " 'ERROR','INFORMATIONAL','SERIOUS','SEVERE','TERMINATING', or 'WARNING'."
                 )
-            setdef_subcmd += f" FLAG({kwargs['flag']})"
+            setdef_parts.append(_PARAM_TMPL.format("FLAG", kwargs["flag"]))
 
         # =================
         # LENGTH
@@ -237,9 +242,9 @@ class SetDef(Subcmd):
             if not isinstance(kwargs["length"], (str, int, Hex)):
                 raise ArgumentTypeError("length", kwargs["length"], (str, int, Hex))
             if isinstance(kwargs["length"], (str, int)):
-                setdef_subcmd += f" LENGTH(X'{Hex(kwargs['length'])}')"
+                setdef_parts.append(_HEX_PARAM_TMPL.format("LENGTH", Hex(kwargs["length"])))
             if isinstance(kwargs["length"], Hex):
-                setdef_subcmd += f" LENGTH(X'{kwargs['length']}')"
+                setdef_parts.append(_HEX_PARAM_TMPL.format("LENGTH", kwargs["length"]))
 
         # =====================
         # PDS NOPDS
@@ -248,10 +253,7 @@ class SetDef(Subcmd):
         if "pds" in kwargs:
             if not isinstance(kwargs["pds"], bool):
                 raise ArgumentTypeError("pds", kwargs["pds"], bool)
-            if kwargs["pds"]:
-                setdef_subcmd += " PDS"
-            else:
-                setdef_subcmd += " NOPDS"
+            setdef_parts.append("PDS" if kwargs["pds"] else "NOPDS")
 
         # =================
         # ASID
@@ -261,9 +263,9 @@ class SetDef(Subcmd):
             if not isinstance(kwargs["asid"], (str, int, Hex)):
                 raise ArgumentTypeError("asid", kwargs["asid"], (str, int, Hex))
             if isinstance(kwargs["asid"], (str, int)):
-                setdef_subcmd += f" ASID(X'{Hex(kwargs['asid'])}')"
+                setdef_parts.append(_HEX_PARAM_TMPL.format("ASID", Hex(kwargs["asid"])))
             if isinstance(kwargs["asid"], Hex):
-                setdef_subcmd += f" ASID(X'{kwargs['asid']}')"
+                setdef_parts.append(_HEX_PARAM_TMPL.format("ASID", kwargs["asid"]))
 
         # ====================
         # DSPNAME
@@ -272,7 +274,7 @@ class SetDef(Subcmd):
         if "dspname" in kwargs:
             if not isinstance(kwargs["dspname"], str):
                 raise ArgumentTypeError("dspname", kwargs["dspname"], str)
-            setdef_subcmd += f" DSPNAME({kwargs['dspname']})"
+            setdef_parts.append(_PARAM_TMPL.format("DSPNAME", kwargs["dspname"]))
 
         # ===================
         # Other Parameters
@@ -281,7 +283,7 @@ class SetDef(Subcmd):
         if "setdef_params" in kwargs:
             if not isinstance(kwargs["setdef_params"], str):
                 raise ArgumentTypeError("setdef_params", kwargs["setdef_params"], str)
-            setdef_subcmd += f" {kwargs['setdef_params']}"
+            setdef_parts.append(kwargs["setdef_params"])
 
         # ========================
         # Run SETDEF Subcommand
@@ -289,7 +291,7 @@ class SetDef(Subcmd):
 
         super().__init__(
             session,
-            setdef_subcmd,
+            " ".join(setdef_parts),
             outfile=outfile,
             keep_file=keep_file,
         )
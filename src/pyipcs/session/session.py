@@ -2,12 +2,17 @@
 IpcsSession Object
 """
 
+from __future__ import annotations
 import os
-import atexit
-import random
+import re
+import sys
+import weakref
+import time
 import warnings
+import threading
 from datetime import datetime
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from zoautil_py import datasets
 from zoautil_py import exceptions
 from ..hex_obj import Hex
@@ -15,11 +20,127 @@ from ..dump import Dump
 from ..subcmd import Subcmd
 from ..error_handling import InvalidReturnCodeError, SessionNotActiveError, ArgumentTypeError
 from ..tso_shell import tsocmd
-from ..util.zoautil_py_util import datasets_recall_exists
+from ..util.zoautil_py_util import (
+    datasets_list_names,
+    datasets_create_many,
+    datasets_write_many,
+    unused_dataset_id,
+)
 from .allocations import IpcsAllocations
 from .ddir import DumpDirectory
 from .dataset_content import IPCSRUN, IPCSEVAL, IPACTIVE
 
+# Maximum number of reads passed to a single IPCSEVAL invocation
+_EVALUATE_BATCH_SIZE = 32
+# Accepted types for a read address. Checked for every read in evaluate_many
+_HEX_ADDRESS_TYPES = (Hex, str, int)
+# IPCSEVAL arguments for a single read (hex address, decimal offset, decimal length)
+_IPCSEVAL_READ_TMPL = "{} {} {}"
+# Seconds that a successful IPACTIVE check is reused by attribute active
+_ACTIVE_CHECK_TTL = 0.5
+# Maximum number of session datasets deleted concurrently on close
+_DELETE_WORKERS = 8
+# Message for session datasets left in an unknown state. Formatted with the session hlq_full
+_CORRUPTION_MSG_TMPL = (
+    "Potential pyIPCS Session Corruption"
+    " - Please manually delete all datasets with the pattern '{}*'"
+)
+
+
+def _cleanup_at_exit(session_ref: weakref.ref) -> None:
+    """
+    Cleanup for pyIPCS session at interpreter exit if the session still exists.
+
+    Sessions that are garbage collected before exit are cleaned up by `IpcsSession.__del__`.
+
+    Parameters
+    ----------
+    session_ref : weakref.ref
+        Weak reference to pyipcs.IpcsSession
+
+    Returns
+    -------
+    None
+    """
+    session = session_ref()
+    if session is not None:
+        session.__cleanup__()
+
+
+def _evaluate_read(request: tuple[Hex | str | int, int, int]) -> tuple[str, int, int]:
+    """
+    Check a single `IpcsSession.evaluate_many` request and convert it to a read.
+
+    Parameters
+    ----------
+    request : tuple[pyipcs.Hex|str|int, int, int]
+        `(hex_address, dec_offset, dec_length)` tuple.
+
+    Returns
+    -------
+    tuple[str,int,int]
+        `(address, start, end)` tuple where `address` is passed to IPCSEVAL
+        and `start`/`end` are decimal offsets from the address.
+    """
+    if not isinstance(request, tuple) or len(request) != 3:
+        raise TypeError(
+            "Elements of 'requests' list must be tuples of"
+            + " (hex_address, dec_offset, dec_length)"
+        )
+    hex_address, dec_offset, dec_length = request
+    if not isinstance(hex_address, _HEX_ADDRESS_TYPES):
+        raise ArgumentTypeError("hex_address", hex_address, _HEX_ADDRESS_TYPES)
+    if not isinstance(dec_offset, int):
+        raise ArgumentTypeError("dec_offset", dec_offset, int)
+    if not isinstance(dec_length, int):
+        raise ArgumentTypeError("dec_length", dec_length, int)
+    if dec_length < 0:
+        raise ValueError("Argument 'dec_length' cannot be negative")
+    # String addresses are passed to IPCSEVAL as given (ex: '_' separated addresses)
+    if isinstance(hex_address, str):
+        address = hex_address.strip()
+    elif isinstance(hex_address, int):
+        address = str(Hex(hex_address))
+    else:
+        address = str(hex_address)
+    return (address, dec_offset, dec_offset + dec_length)
+
+
+def _merge_reads(reads: list[tuple[str, int, int]]) -> list[tuple[str, int, int]]:
+    """
+    Merge overlapping or adjacent reads from the same address.
+
+    Zero length reads do not need to be evaluated and are left out.
+
+    Parameters
+    ----------
+    reads : list[tuple[str,int,int]]
+        List of `(address, start, end)` tuples.
+
+    Returns
+    -------
+    list[tuple[str,int,int]]
+        List of merged `(address, start, end)` tuples.
+    """
+    spans_by_address = {}
+    for address, start, end in reads:
+        if start != end:
+            spans_by_address.setdefault(address, []).append((start, end))
+
+    merged_ranges = []
+    for address, spans in spans_by_address.items():
+        spans.sort()
+        merged_start, merged_end = spans[0]
+        for start, end in spans[1:]:
+            if start <= merged_end:
+                merged_end = max(merged_end, end)
+            else:
+                merged_ranges.append((address, merged_start, merged_end))
+                merged_start, merged_end = start, end
+        merged_ranges.append((address, merged_start, merged_end))
+    return merged_ranges
+
+
 class IpcsSession:
     """
     IPCS Session Object
@@ -81,6 +202,10 @@ class IpcsSession:
         Will set IPCS session DDIR to `ddir`.
         Will set IPCS default DSNAME to `dsname`.
 
+    init_dump_many(dsnames, ddir="", use_cur_ddir=False)
+        Initialize multiple dumps under a single dump directory `ddir`
+        and return list of Dump objects.
+
     set_dump(dump)
         Set IPCS session DDIR to Dump object DDIR.
         Set IPCS default DSNAME to Dump object dataset name.
@@ -90,8 +215,32 @@ class IpcsSession:
         
     evaluate(hex_address, dec_offset, dec_length)
         Read data from dump. Similar to EVALUATE subcommand in REXX.
+
+    evaluate_many(requests)
+        Read multiple pieces of data from dump in a single IPCS invocation.
     """
 
+    __slots__ = (
+        "__uid",
+        "__time_opened",
+        "__userid",
+        "__active_checked",
+        "__exit_cleanup",
+        "__hlq",
+        "__directory",
+        "__hlq_full",
+        "__directory_full",
+        "__ipcsexec_dsname",
+        "__ipcsexec_execs",
+        "__sysexec_dsname",
+        "__sysexec_execs",
+        "__ipactive_content",
+        "__ipactive_regex",
+        "_aloc",
+        "_ddir",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         hlq: str | None = None,
@@ -133,8 +282,14 @@ class IpcsSession:
         self.__uid = None
         # Time that session was opened. `None` when session is not open
         self.__time_opened = None
-        # Setup cleanup
-        atexit.register(self.__cleanup__)
+        # z/OS userid. Resolved on first access of attribute userid
+        self.__userid = None
+        # Monotonic time of last successful IPACTIVE check. `None` when not checked
+        self.__active_checked = None
+        # Session dataset names. Set on open and `None` when session is not open
+        self.__set_session_names()
+        # Cleanup at interpreter exit. Only registered while the session is open
+        self.__exit_cleanup = None
 
         # ===========================
         # Argument Type Checking
@@ -161,8 +316,8 @@ class IpcsSession:
         self.__directory = os.getcwd() if directory is None else directory
         # Set initial allocations
         self._aloc = IpcsAllocations(allocations)
-        # Set up DumpDirectory object
-        self._ddir = DumpDirectory(self)
+        # DumpDirectory object. Created on first access of attribute ddir
+        self._ddir = None
 
     def open(self) -> None:
         """
@@ -179,15 +334,18 @@ class IpcsSession:
             warnings.warn("Current IPCS session is already active/open", UserWarning)
             return
 
-        # Generate session id until you find one that does not exist
+        # Generate session id that is not used by any existing session datasets
         # Session HLQ is dependent on the id
-        self.__uid = "S" + "".join(random.choices("0123456789", k=5))
-        while datasets_recall_exists(self.hlq_full):
-            self.__uid = "S" + "".join(random.choices("0123456789", k=5))
+        self.__uid = "S" + unused_dataset_id(f"{self.hlq}.PYIPCS.S")
 
         # Mark the time the session was opened
         self.__time_opened = datetime.now().strftime("%Y-%m-%d_%H-%M-%S-%f")
 
+        self.__set_session_names()
+
+        # Setup cleanup at interpreter exit without keeping the session alive
+        self.__exit_cleanup = weakref.finalize(self, _cleanup_at_exit, weakref.ref(self))
+
         # Create Initial Session DDIR
         init_ddir = f"{self.hlq_full}.INIT.DDIR"
         self.ddir.create(init_ddir)
@@ -196,8 +354,11 @@ class IpcsSession:
             self.__create_session_datasets(init_ddir)
         except exceptions.DatasetWriteException:
             self.ddir._delete(init_ddir)
-        # Set init ddir
-        self.ddir.use(init_ddir)
+        # Set init ddir. It was just created so skip the existence check
+        self.ddir._use(init_ddir)
+        # Verify the new session with IPACTIVE
+        # Later `active` checks within the TTL reuse this result
+        self.__check_ipactive()
 
 
     def close(self) -> None:
@@ -224,6 +385,12 @@ class IpcsSession:
         self.ddir._clear()
         self.__time_opened = None
         self.__uid = None
+        self.__set_session_names()
+        self.__active_checked = None
+
+        # Nothing left to cleanup at interpreter exit
+        self.__exit_cleanup.detach()
+        self.__exit_cleanup = None
 
 
     def init_dump(
@@ -255,11 +422,61 @@ class IpcsSession:
         -------
         pyipcs.Dump
         """
-        if not self.active:
+        # Dump checks that the session is active before running subcommands
+        if not self._opened:
             raise SessionNotActiveError()
 
         return Dump(self, dsname, ddir=ddir, use_cur_ddir=use_cur_ddir)
 
+    def init_dump_many(
+        self, dsnames: list[str], ddir: str = "", use_cur_ddir: bool = False
+    ) -> list[Dump]:
+        """
+        Initialize multiple dumps under a single dump directory `ddir`
+        and return list of Dump objects.
+
+        Dumps are initialized one at a time with `init_dump()`, each running its own subcommands.
+        Only creating and setting the DDIR is shared:
+        the DDIR is only created and set for the first dump
+        and the remaining dumps are initialized under the current session DDIR.
+
+        Will set IPCS session DDIR to `ddir`.
+
+        Will set IPCS default `DSNAME` to the last dump in `dsnames`.
+
+        Parameters
+        ----------
+        dsnames : list[str]
+            List of dump dataset names.
+        
+        ddir : str, optional
+            Dump directory.
+            If an empty string, dumps will be initialized under a single temporary DDIR.
+
+        use_cur_ddir : bool, optional
+            Use current session DDIR.
+            Will use the IpcsSession attribute `ddir` to initialize the dumps under.
+            This will take precedence over this function's `ddir` parameter.
+            Default is `False`.
+        
+        Returns
+        -------
+        list[pyipcs.Dump]
+            Dump objects in the same order as `dsnames`.
+        """
+        if not isinstance(dsnames, list):
+            raise ArgumentTypeError("dsnames", dsnames, list)
+        if not all(isinstance(dsname, str) for dsname in dsnames):
+            raise TypeError("Elements of 'dsnames' list must be of type str")
+        if not dsnames:
+            return []
+
+        # First dump creates and sets the DDIR. The rest reuse it without another BLSCDDIR
+        dumps = [self.init_dump(dsnames[0], ddir=ddir, use_cur_ddir=use_cur_ddir)]
+        for dsname in dsnames[1:]:
+            dumps.append(self.init_dump(dsname, use_cur_ddir=True))
+        return dumps
+
     def set_dump(self, dump: Dump) -> None:
         """
         Set IPCS session DDIR to Dump object DDIR.
@@ -274,14 +491,15 @@ class IpcsSession:
         -------
         None
         """
-        if not self.active:
+        # DumpDirectory.use and Subcmd check that the session is active
+        if not self._opened:
             raise SessionNotActiveError()
 
         # Set DDIR
         self.ddir.use(dump.ddir)
 
         # Check that dump is still initialized under DDIR
-        if dump.dsname not in self.ddir.sources():
+        if not self.ddir._has_source(dump.dsname):
             raise RuntimeError(
                 f"Dump {dump.dsname} is not initialized under dump directory {dump.ddir}"
             )
@@ -323,34 +541,116 @@ class IpcsSession:
         pyipcs.Hex
             Hex object representing the data at the specified address.
         """
-        if not self.active:
+        return self.evaluate_many([(hex_address, dec_offset, dec_length)])[0]
+
+    def evaluate_many(
+        self,
+        requests: list[tuple[Hex | str | int, int, int]],
+    ) -> list[Hex]:
+        """
+        Read multiple pieces of data from dump in a single IPCS invocation.
+
+        Overlapping or adjacent reads from the same starting address are merged
+        so each range of storage is only evaluated once.
+
+        Make sure to set correct defaults `DSNAME`, `ASID`, and `DSPNAME`
+        prior to calling this method.
+
+        https://www.ibm.com/docs/en/zos/3.1.0?topic=instruction-evaluate-subcommand
+
+        Parameters
+        ----------
+        requests : list[tuple[pyipcs.Hex|str|int, int, int]]
+            List of `(hex_address, dec_offset, dec_length)` tuples.
+            Each tuple takes the same values as the parameters of `evaluate()`.
+
+        Returns
+        -------
+        list[pyipcs.Hex]
+            Hex objects representing the data for each request, in the same order as `requests`.
+        """
+        # Subcmd checks that the session is active before running IPCSEVAL
+        if not self._opened:
             raise SessionNotActiveError()
 
-        if not isinstance(hex_address, (Hex, str, int)):
-            raise ArgumentTypeError("hex_address", hex_address, (Hex, str, int))
-        if not isinstance(dec_offset, int):
-            raise ArgumentTypeError("dec_offset", dec_offset, int)
-        if not isinstance(dec_length, int):
-            raise ArgumentTypeError("dec_length", dec_length, int)
-
-        ipcseval = Subcmd(self, f"IPCSEVAL {hex_address} {dec_offset} {dec_length}")
-
-        if ipcseval.rc != 0:
-            raise InvalidReturnCodeError(
-                ipcseval.subcmd + " - pyIPCS Temporary EXEC",
-                ipcseval.output,
-                ipcseval.rc,
-                0,
-            )
+        if not isinstance(requests, list):
+            raise ArgumentTypeError("requests", requests, list)
+
+        # ===========================
+        # Argument Type Checking
+        # ===========================
 
-        return Hex(ipcseval.output)
+        reads = [_evaluate_read(request) for request in requests]
+
+        # ==============================================================
+        # Merge overlapping or adjacent reads from the same address
+        # Addresses are compared as they are passed to IPCSEVAL
+        # ==============================================================
+
+        merged_ranges = _merge_reads(reads)
+
+        # ========================================
+        # Evaluate merged ranges in IPCS batches
+        # ========================================
+
+        merged_args = [
+            _IPCSEVAL_READ_TMPL.format(address, start, end - start)
+            for address, start, end in merged_ranges
+        ]
+
+        merged_data = []
+        for batch_start in range(0, len(merged_args), _EVALUATE_BATCH_SIZE):
+            batch = merged_args[batch_start:batch_start + _EVALUATE_BATCH_SIZE]
+            ipcseval = Subcmd(self, "IPCSEVAL " + " ".join(batch))
+            if ipcseval.rc != 0:
+                raise InvalidReturnCodeError(
+                    ipcseval.subcmd + " - pyIPCS Temporary EXEC",
+                    ipcseval.output,
+                    ipcseval.rc,
+                    0,
+                )
+            # Each result is prefixed with ':' and may be wrapped across lines
+            batch_data = "".join(ipcseval.output.split()).split(":")[1:]
+            # Results are matched to reads by position so every read must have one result
+            if len(batch_data) != len(batch):
+                raise RuntimeError(
+                    "Failed To Parse IPCSEVAL Output"
+                    + f" - Expected {len(batch)} Results, Got {len(batch_data)}\n"
+                    + f"\nIPCS Subcommand: {ipcseval.subcmd}\n"
+                    + f"\nOutput:\n\n {ipcseval.output}\n"
+                )
+            merged_data.extend(batch_data)
+
+        # =============================================
+        # Slice each request out of its merged range
+        # =============================================
+
+        merged_lookup = {}
+        for (address, start, end), data in zip(merged_ranges, merged_data):
+            merged_lookup.setdefault(address, []).append((start, end, data))
+
+        results = []
+        for address, start, end in reads:
+            if start == end:
+                results.append(Hex(""))
+                continue
+            for merged_start, merged_end, data in merged_lookup[address]:
+                if merged_start <= start and end <= merged_end:
+                    results.append(
+                        Hex(data[(start - merged_start) * 2:(end - merged_start) * 2])
+                    )
+                    break
+        return results
 
     @property
     def userid(self) -> str:
         """
         Attribute userid
         """
-        return datasets.get_hlq() if datasets.get_hlq() else os.getenv("USER", "TEMP")
+        if self.__userid is None:
+            userid = datasets.get_hlq()
+            self.__userid = userid if userid else os.getenv("USER", "TEMP")
+        return self.__userid
 
     @property
     def hlq(self) -> str:
@@ -371,32 +671,23 @@ class IpcsSession:
         """
         Attribute active
         """
+        # Read private attributes directly since this is checked by every session operation
         # If id and time opened are not set then the session is not active
-        if self.uid is None and self._time_opened is None:
+        if self.__uid is None and self.__time_opened is None:
             return False
         # If only one is set the session is corrupted
-        if self.uid is None:
+        if self.__uid is None:
             raise RuntimeError("Potential pyIPCS Session Corruption - Exiting")
-        if self._time_opened is None:
-            raise RuntimeError(
-                "Potential pyIPCS Session Corruption"
-                + f" - Please manually delete all datasets with the pattern '{self.hlq_full}*'"
-            )
-        # Check if IPACTIVE output matches intended output
-        completed_tsocmd = tsocmd(
-            f"ex \'{self._ipcsexec_execs['IPACTIVE']}\'",
-            allocations={"IPCSEXEC": self._ipcsexec_dsname}
-        )
+        if self.__time_opened is None:
+            raise RuntimeError(_CORRUPTION_MSG_TMPL.format(self.__hlq_full))
+        # Reuse a recent successful IPACTIVE check
         if (
-            f"USERID: {self.userid}" in completed_tsocmd["output"]
-            and f"TIME OPENED: {self._time_opened}" in completed_tsocmd["output"]
+            self.__active_checked is not None
+            and time.monotonic() - self.__active_checked < _ACTIVE_CHECK_TTL
         ):
             return True
-        # If output does not match session has become corrupted
-        raise RuntimeError(
-            "Potential pyIPCS Session Corruption"
-            + f" - Please manually delete all datasets with the pattern '{self.hlq_full}*'"
-        )
+        self.__check_ipactive()
+        return True
 
     @property
     def aloc(self) -> IpcsAllocations:
@@ -410,6 +701,8 @@ class IpcsSession:
         """
         Attribute ddir
         """
+        if self._ddir is None:
+            self._ddir = DumpDirectory(self)
         return self._ddir
 
     @property
@@ -424,20 +717,24 @@ class IpcsSession:
         """
         Attribute hlq_full
         """
-        if not self.uid:
-            return None
-        return f"{self.hlq}.PYIPCS.{self.uid}"
+        return self.__hlq_full
 
     @property
     def directory_full(self) -> str | None:
         """
         Attribute directory_full
         """
-        if not self.uid:
-            return None
-        directory_full_path = Path(self.directory) / "pyipcs_directory"
-        directory_full_path = directory_full_path / f"{self.uid}.{self._time_opened}"
-        return str(directory_full_path)
+        return self.__directory_full
+
+    @property
+    def _opened(self) -> bool:
+        """
+        Protected Attribute _opened
+
+        `True` if session id and time opened are set.
+        Cheap check for methods where a later step runs the full `active` check.
+        """
+        return self.__uid is not None and self.__time_opened is not None
 
     @property
     def _time_opened(self) -> str | None:
@@ -449,45 +746,104 @@ class IpcsSession:
         return self.__time_opened
 
     @property
-    def _ipcsexec_dsname(self) -> str:
+    def _ipcsexec_dsname(self) -> str | None:
         """
         Protected Attribute _ipcsexec_dsname
 
         Dataset name for dataset that contains pyIPCS IPCSEXEC execs
         """
-        return f"{self.hlq_full}.IPCSEXEC"
+        return self.__ipcsexec_dsname
 
     @property
-    def _ipcsexec_execs(self) -> dict[str, str]:
+    def _ipcsexec_execs(self) -> dict[str, str] | None:
         """
         Protected Attribute _ipcsexec_execs
 
         IPCSEXEC execs that map from exec name to the fully qualified member name
         """
-        return {
-            "IPACTIVE": f"{self._ipcsexec_dsname}(IPACTIVE)",
-            "IPCSRUN": f"{self._ipcsexec_dsname}(IPCSRUN)",
-        }
+        return self.__ipcsexec_execs
 
     @property
-    def _sysexec_dsname(self) -> str:
+    def _sysexec_dsname(self) -> str | None:
         """
         Protected Attribute _sysexec_dsname
 
         Dataset name for dataset that contains pyIPCS SYSEXEC execs
         """
-        return f"{self.hlq_full}.SYSEXEC"
+        return self.__sysexec_dsname
 
     @property
-    def _sysexec_execs(self) -> dict[str, str]:
+    def _sysexec_execs(self) -> dict[str, str] | None:
         """
         Protected Attribute _sysexec_execs
 
         SYSEXEC execs that map from exec name to the fully qualified member name
         """
-        return {
-            "IPCSEVAL": f"{self._sysexec_dsname}(IPCSEVAL)"
+        return self.__sysexec_execs
+
+    def __set_session_names(self) -> None:
+        """
+        Private Function __set_session_names Set session names from the session id.
+
+        Dataset names and the session directory are computed once per opened session
+        instead of on every attribute access.
+        Also formats the IPACTIVE exec and compiles the regex matching its output.
+        All names are set to `None` when the session id is not set.
+
+        Returns
+        -------
+        None
+        """
+        if not self.uid:
+            self.__hlq_full = None
+            self.__directory_full = None
+            self.__ipcsexec_dsname = None
+            self.__ipcsexec_execs = None
+            self.__sysexec_dsname = None
+            self.__sysexec_execs = None
+            self.__ipactive_content = None
+            self.__ipactive_regex = None
+            return
+        self.__hlq_full = f"{self.hlq}.PYIPCS.{self.uid}"
+        directory_full_path = Path(self.directory) / "pyipcs_directory"
+        directory_full_path = directory_full_path / f"{self.uid}.{self._time_opened}"
+        self.__directory_full = str(directory_full_path)
+        self.__ipcsexec_dsname = f"{self.__hlq_full}.IPCSEXEC"
+        self.__ipcsexec_execs = {
+            "IPACTIVE": f"{self.__ipcsexec_dsname}(IPACTIVE)",
+            "IPCSRUN": f"{self.__ipcsexec_dsname}(IPCSRUN)",
+        }
+        self.__sysexec_dsname = f"{self.__hlq_full}.SYSEXEC"
+        self.__sysexec_execs = {
+            "IPCSEVAL": f"{self.__sysexec_dsname}(IPCSEVAL)"
         }
+        self.__ipactive_content = IPACTIVE.format(
+            userid=self.userid, time_opened=self._time_opened
+        )
+        self.__ipactive_regex = re.compile(
+            f"USERID: {re.escape(self.userid)}.*?TIME OPENED: {re.escape(self._time_opened)}",
+            re.S,
+        )
+
+    def __check_ipactive(self) -> None:
+        """
+        Private Function __check_ipactive Run IPACTIVE and check its output.
+
+        Records the time of a successful check so `active` can reuse it.
+
+        Returns
+        -------
+        None
+        """
+        # Check if IPACTIVE output matches intended output
+        completed_tsocmd = tsocmd(
+            f"ex \'{self.__ipcsexec_execs['IPACTIVE']}\'",
+            allocations={"IPCSEXEC": self.__ipcsexec_dsname}
+        )
+        if not self.__ipactive_regex.search(completed_tsocmd["output"]):
+            # If output does not match session has become corrupted
+            raise RuntimeError(_CORRUPTION_MSG_TMPL.format(self.__hlq_full))
+        self.__active_checked = time.monotonic()
 
     def __create_session_datasets(self, init_ddir: str) -> None:
         """
@@ -503,28 +859,22 @@ class IpcsSession:
         None
         """
         try:
-            # Main Session Dataset
-            # Write Initial DDIR to dataset
-            datasets.create(self.hlq_full, dataset_type="SEQ")
-            datasets.write(self.hlq_full, content=init_ddir)
-            # All IPCSEXEC execs
-            datasets.create(f"{self.hlq_full}.IPCSEXEC", dataset_type="PDSE")
-            datasets.write(
-                self._ipcsexec_execs["IPACTIVE"],
-                content=IPACTIVE.format(
-                    userid=self.userid,
-                    time_opened=self._time_opened
-                )
-            )
-            datasets.write(
-                self._ipcsexec_execs["IPCSRUN"],
-                content=IPCSRUN
+            # Main Session Dataset, IPCSEXEC execs dataset, and SYSEXEC execs dataset
+            datasets_create_many(
+                [
+                    (self.hlq_full, "SEQ"),
+                    (self._ipcsexec_dsname, "PDSE"),
+                    (self._sysexec_dsname, "PDSE"),
+                ]
             )
-            # All SYSEXEC execs
-            datasets.create(f"{self.hlq_full}.SYSEXEC", dataset_type="PDSE")
-            datasets.write(
-                self._sysexec_execs["IPCSEVAL"],
-                content=IPCSEVAL
+            # Write Initial DDIR and all execs. Only writes to different datasets run concurrently
+            datasets_write_many(
+                [
+                    (self.hlq_full, init_ddir),
+                    (self._ipcsexec_execs["IPACTIVE"], self.__ipactive_content),
+                    (self._ipcsexec_execs["IPCSRUN"], IPCSRUN),
+                    (self._sysexec_execs["IPCSEVAL"], IPCSEVAL),
+                ]
             )
         except exceptions.DatasetWriteException as e:
             raise RuntimeError(
@@ -538,61 +888,108 @@ class IpcsSession:
         """
         Private Function __delete_temp_datasets Delete pyIPCS temporary datasets.
 
+        Existing session datasets are listed once before and once after the deletes
+        instead of checking each dataset individually.
+
         Returns
         -------
         None
         """
+        # Values are constant for the whole close so only read the attributes once
+        hlq_full = self.hlq_full
+        ddir_obj = self.ddir
+
+        def list_session_datasets() -> set[str]:
+            # Main session dataset and all datasets under it
+            return (
+                datasets_list_names(hlq_full)
+                | datasets_list_names(f"{hlq_full}.**")
+            )
+
+        existing_dsnames = list_session_datasets()
+
+        # Warning message is the same for every failed step
+        corruption_msg = _CORRUPTION_MSG_TMPL.format(hlq_full)
+
+        # Deletes run in worker threads so serialize their warnings
+        warnings_lock = threading.Lock()
+
+        # Missing datasets are skipped. Failed deletes are caught by the final listing
         def delete_session_dataset(non_vsam_dsname: str) -> None:
-            if not datasets_recall_exists(non_vsam_dsname):
-                warnings.warn(
-                    "Potential pyIPCS Session Corruption - Please manually delete all datasets"
-                    + f" with the pattern '{self.hlq_full}*'",
-                    UserWarning
-                )
-            rc = datasets.delete(non_vsam_dsname)
-            if rc != 0:
-                warnings.warn(
-                    "Potential pyIPCS Session Corruption - Please manually delete all datasets"
-                    + f" with the pattern '{self.hlq_full}*'",
-                    UserWarning
-                )
+            if non_vsam_dsname not in existing_dsnames:
+                with warnings_lock:
+                    warnings.warn(corruption_msg, UserWarning)
+                return
+            datasets.delete(non_vsam_dsname)
 
         def delete_ddir_session_dataset(ddir_dsname: str) -> None:
-            if not datasets_recall_exists(ddir_dsname):
-                warnings.warn(
-                    "Potential pyIPCS Session Corruption - Please manually delete all datasets"
-                    + f" with the pattern '{self.hlq_full}*'",
-                    UserWarning
-                )
-            self.ddir._delete(ddir_dsname)
-            if datasets_recall_exists(ddir_dsname):
-                warnings.warn(
-                    "Potential pyIPCS Session Corruption - Please manually delete all datasets"
-                    + f" with the pattern '{self.hlq_full}*'",
-                    UserWarning
-                )
-
-        # Delete all DDIRs in the main session dataset
-        if datasets_recall_exists(self.hlq_full):
+            if ddir_dsname not in existing_dsnames:
+                with warnings_lock:
+                    warnings.warn(corruption_msg, UserWarning)
+                return
+            ddir_obj._delete(ddir_dsname, check_exists=False)
+
+        # Get all DDIRs in the main session dataset
+        ddirs = []
+        if hlq_full in existing_dsnames:
             try:
-                ddirs = datasets.read(self.hlq_full).splitlines()
+                ddirs = [
+                    ddir.strip() for ddir in datasets.read(hlq_full).splitlines()
+                    if ddir.strip()
+                ]
             except exceptions.DatasetFetchException:
-                warnings.warn(
-                    "Potential pyIPCS Session Corruption - Please manually delete all datasets"
-                    + f" with the pattern '{self.hlq_full}*'",
-                    UserWarning
-                )
-            for ddir in ddirs:
-                delete_ddir_session_dataset(ddir.strip())
+                warnings.warn(corruption_msg, UserWarning)
         else:
-            warnings.warn(
-                "Potential pyIPCS Session Corruption - Please manually delete all datasets"
-                + f" with the pattern '{self.hlq_full}*'",
-                UserWarning
-            )
-        delete_session_dataset(self._ipcsexec_dsname)
-        delete_session_dataset(self._sysexec_dsname)
-        delete_session_dataset(self.hlq_full)
+            warnings.warn(corruption_msg, UserWarning)
+
+        deletes = [(delete_ddir_session_dataset, ddir) for ddir in ddirs]
+        deletes += [
+            (delete_session_dataset, non_vsam_dsname)
+            for non_vsam_dsname in (self._ipcsexec_dsname, self._sysexec_dsname)
+        ]
+
+        # Session datasets are independent of each other so delete them concurrently
+        with ThreadPoolExecutor(max_workers=min(_DELETE_WORKERS, len(deletes))) as executor:
+            try:
+                futures = [executor.submit(delete, dsname) for delete, dsname in deletes]
+            except RuntimeError:
+                # Threads cannot be started during interpreter shutdown (atexit cleanup)
+                futures = []
+                for delete, dsname in deletes:
+                    delete(dsname)
+            for future in futures:
+                future.result()
+
+        # Main session dataset tracks the session DDIRs so delete it last
+        delete_session_dataset(hlq_full)
+
+        # Check that no session datasets remain
+        if list_session_datasets():
+            warnings.warn(corruption_msg, UserWarning)
+
+    def __enter__(self) -> IpcsSession:
+        """
+        Opens IPCS/TSO Session on entering a `with` statement.
+
+        Returns
+        -------
+        pyipcs.IpcsSession
+            This session.
+        """
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Closes IPCS/TSO Session if active on leaving a `with` statement.
+
+        Exceptions raised in the `with` block are not suppressed.
+
+        Returns
+        -------
+        None
+        """
+        self.__cleanup__()
 
     def __cleanup__(self) -> None:
         """
@@ -602,7 +999,8 @@ class IpcsSession:
         -------
         None
         """
-        if self.active:
+        # Only check local state here. close() runs the full active check
+        if self._opened:
             self.close()
 
     def __del__(self) -> None:
@@ -613,4 +1011,8 @@ class IpcsSession:
         -------
         None
         """
+        # Open sessions were already closed by the exit cleanup before finalization
+        # and TSO commands cannot be relied on while modules are being torn down
+        if sys.is_finalizing():
+            return
         self.__cleanup__()
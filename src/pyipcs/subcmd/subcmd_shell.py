@@ -6,7 +6,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pathlib import Path
 import subprocess
-import copy
 from ..tso_shell import tsocmd, construct_tso_shell_script, CalledTsoProcessError
 
 if TYPE_CHECKING:
@@ -15,6 +14,11 @@ if TYPE_CHECKING:
 
 IPCS_EX_SUBCMD = """ex \'{ipcs_subcmd_exec}\' \'subcmd(\'\'{ipcs_subcmd}\'\')\'"""
 
+# Markers written by the IPCSRUN CLIST around the subcommand output
+# The end marker is followed by the subcommand return code on the same line
+SUBCMD_START = "___SUBCMD_START___"
+SUBCMD_END = "___SUBCMD_END___"
+
 
 def construct_ipcs_shell_script(session: IpcsSession, ipcs_subcmd: str) -> str:
     """
@@ -59,19 +63,19 @@ def construct_allocations(session: IpcsSession) -> dict[str, str | list[str]]:
         Constructed string for IPCS subcommand shell script
     """
 
+    # Allocations are already a copy so they can be modified without copying again
     allocations_copy = session.aloc.get()
+    allocations_sysexec = allocations_copy.get("SYSEXEC", [])
 
     allocations_copy["IPCSDDIR"] = [session.ddir.dsname]
     allocations_copy["IPCSEXEC"] = [session._ipcsexec_dsname]
     allocations_copy["SYSEXEC"] = [session._sysexec_dsname]
 
     # Add in SYSEXEC from user allocations
-    if "SYSEXEC" in session.aloc.get():
-        allocations_sysexec = copy.deepcopy(session.aloc.get()["SYSEXEC"])
-        if isinstance(allocations_sysexec, str):
-            allocations_copy["SYSEXEC"].append(allocations_sysexec)
-        else:
-            allocations_copy["SYSEXEC"].extend(allocations_sysexec)
+    if isinstance(allocations_sysexec, str):
+        allocations_copy["SYSEXEC"].append(allocations_sysexec)
+    else:
+        allocations_copy["SYSEXEC"].extend(allocations_sysexec)
 
     return allocations_copy
 
@@ -112,17 +116,13 @@ def run_ipcs_subcmd(session: IpcsSession, ipcs_subcmd: str, auth: bool) -> dict:
     # Parse out subcommand output and return code
     # ===============================================
 
-    # Return code is written the line after ___SUBCMD_RC_START___
     # Subcommand output is written between lines ___SUBCMD_START___ and ___SUBCMD_END___
-    subcmd_start_index = shell_output.find("___SUBCMD_START___")
-    return_code_index = shell_output.rfind("___SUBCMD_RC_START___")
+    # Return code is written on the ___SUBCMD_END___ line after the marker
+    subcmd_start_index = shell_output.find(SUBCMD_START)
+    subcmd_end_index = shell_output.rfind(SUBCMD_END)
+    rc = shell_output[subcmd_end_index + len(SUBCMD_END):].split(maxsplit=1)[:1]
 
-    if return_code_index != -1:
-        subcmd_end_index = shell_output.rfind("___SUBCMD_END___", 0, return_code_index)
-    else:
-        subcmd_end_index = -1
-
-    if subcmd_start_index == -1 or subcmd_end_index == -1 or return_code_index == -1:
+    if subcmd_start_index == -1 or subcmd_end_index == -1 or not rc:
         raise RuntimeError(
             "Failed To Parse Subcommand Output"
             + " or Return Code In IPCS Subcommand Shell Script Output\n"
@@ -131,9 +131,9 @@ def run_ipcs_subcmd(session: IpcsSession, ipcs_subcmd: str, auth: bool) -> dict:
         )
 
     return {
-        "rc": int(shell_output[return_code_index:].splitlines()[1]),
+        "rc": int(rc[0]),
         "output": shell_output[
-            subcmd_start_index + len("___SUBCMD_START___\n") : (subcmd_end_index - 1)
+            subcmd_start_index + len(SUBCMD_START) + 1 : (subcmd_end_index - 1)
         ],
     }
 
@@ -237,7 +237,7 @@ def run_ipcs_subcmd_outfile(
 
         found_subcmd_start = False
         found_subcmd_end = False
-        found_return_code = False
+        rc = None
 
         outfile_obj_tmp.seek(0)
 
@@ -245,20 +245,21 @@ def run_ipcs_subcmd_outfile(
         # The next line will be the start of the output
 
         for line in outfile_obj_tmp:
-            if "___SUBCMD_START___" in line:
+            if SUBCMD_START in line:
                 found_subcmd_start = True
                 break
 
         # Store lines in subcommand output file until you hit ___SUBCMD_END___
         # If next line is ___SUBCMD_END___ - remove endline character from final output line
-        # The next line after that would then be ___SUBCMD_RC_START___, then the return code
+        # The ___SUBCMD_END___ line also contains the return code
 
         if found_subcmd_start:
             # Start reading subcmd output
             subcmd_output_line = outfile_obj_tmp.readline()
             for line in outfile_obj_tmp:
-                if "___SUBCMD_END___" in line:
+                if SUBCMD_END in line:
                     found_subcmd_end = True
+                    rc = line[line.find(SUBCMD_END) + len(SUBCMD_END):].split(maxsplit=1)[:1]
                     if subcmd_output_line[-1] == "\n":
                         outfile_obj.write(subcmd_output_line[:-1])
                     else:
@@ -267,17 +268,9 @@ def run_ipcs_subcmd_outfile(
                 outfile_obj.write(subcmd_output_line)
                 subcmd_output_line = line
 
-        # Start reading return code
-
-        if found_subcmd_end:
-            for line in outfile_obj_tmp:
-                if "___SUBCMD_RC_START___" in line:
-                    found_return_code = True
-                    break
-
         # If we failed to parse something, delete files and raise error
 
-        if not found_subcmd_start or not found_subcmd_end or not found_return_code:
+        if not found_subcmd_start or not found_subcmd_end or not rc:
             outfile_obj_tmp.seek(0)
             shell_output = outfile_obj_tmp.read()
             outfile_path.unlink()
@@ -290,12 +283,8 @@ def run_ipcs_subcmd_outfile(
                 + f"\nShell Output:\n\n {shell_output}\n"
             )
 
-        # The next line is the return code
-
-        rc = int(outfile_obj_tmp.readline().strip())
-
     # Remove temp file and directory before returning
 
     tmp_path.unlink()
     tmp_path.parent.rmdir()
-    return {"rc": rc, "filepath": filepath}
+    return {"rc": int(rc[0]), "filepath": filepath}
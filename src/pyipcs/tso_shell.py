@@ -75,7 +75,8 @@ def construct_tso_shell_script(
     else:
         shell_strings["tsoalloc"] = ""
 
-    shell_strings["allocation_exports"] = ""
+    # Export statements are collected and joined once
+    allocation_exports = []
     for dd_name, specification in allocations.items():
 
         # Specifications for TSO Allocations can be strings
@@ -83,19 +84,17 @@ def construct_tso_shell_script(
         # Concatenation of lists converted to string
         #   of datasets separated by colons
         if isinstance(specification, str):
-            shell_strings[
-                "allocation_exports"
-            ] += f'export {dd_name}="{specification}";\n'
+            allocation_exports.append(f'export {dd_name}="{specification}";\n')
         elif isinstance(specification, list):
             specification_string = ":".join(specification)
-            shell_strings[
-                "allocation_exports"
-            ] += f"export {dd_name}={specification_string};\n"
+            allocation_exports.append(f"export {dd_name}={specification_string};\n")
         else:
             raise TypeError(
                 f"DD name {dd_name} specification"
                 + f" must be of type str or list, got {type(specification)}"
             )
+    shell_strings["allocation_exports"] = "".join(allocation_exports)
+
     return TSO_SHELL_SCRIPT.format(**shell_strings)
 
 
@@ -190,23 +189,28 @@ def tsocmd(
         - **"output"** (str)
             Output of TSO shell script combined with possible error output.
     """
-    # ======================
+    # ============================================================
     # Form TSO shell script
-    # ======================
+    # Without allocations there is nothing to export in a shell
+    #   so the TSO command is run directly
+    # ============================================================
 
-    shell_script = construct_tso_shell_script(
-        tso_command=tso_command,
-        allocations=allocations,
-        omvs=omvs,
-    )
+    if allocations:
+        args = construct_tso_shell_script(
+            tso_command=tso_command,
+            allocations=allocations,
+            omvs=omvs,
+        )
+    else:
+        args = ["tso" if omvs else "tsocmd", tso_command.strip()]
 
     # =============================
-    # Run TSO Command from shell
+    # Run TSO Command
     # =============================
 
     completed_process = subprocess.run(
-        shell_script,
-        shell=True,
+        args,
+        shell=bool(allocations),
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         encoding="ISO-8859-1",
@@ -2,11 +2,18 @@
 pyIPCS zoatuil_py Related Util Functions
 """
 
+import re
+import secrets
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from zoautil_py import datasets, zoau_io
 from ..error_handling import ArgumentTypeError
 from ..hex_obj import Hex
 from ..tso_shell import recall
 
+# Dataset ids are handed out in sequence from a random starting point in each process
+_dataset_id_counter = itertools.count(secrets.randbelow(100000))
+
 # ===================
 # Helper Functions
 # ===================
@@ -80,9 +87,10 @@ def datasets_recall_exists(dsname: str) -> bool:
         raise ArgumentTypeError("dsname", dsname, str)
 
     def zoau_dataset_exists(zoau_dsname: str) -> bool:
-        vsam_dataset_exists = datasets.list_vsam_datasets(zoau_dsname)
-        non_vsam_dataset_exists = datasets.exists(zoau_dsname)
-        return vsam_dataset_exists or non_vsam_dataset_exists
+        # Only check for a non-VSAM dataset if no VSAM dataset was found
+        if datasets.list_vsam_datasets(zoau_dsname):
+            return True
+        return datasets.exists(zoau_dsname)
 
     zoau_bool = zoau_dataset_exists(dsname)
     # If dataset wasn't found attempt recall and check again
@@ -91,6 +99,133 @@ def datasets_recall_exists(dsname: str) -> bool:
         zoau_bool = zoau_dataset_exists(dsname)
     return zoau_bool
 
+
+def datasets_list_names(pattern: str) -> set[str]:
+    """
+    List names of VSAM and non-VSAM datasets matching `pattern`, including migrated datasets.
+
+    Parameters
+    ----------
+    pattern : str
+
+    Returns
+    -------
+    set[str]
+    """
+    if not isinstance(pattern, str):
+        raise ArgumentTypeError("pattern", pattern, str)
+
+    dsnames = datasets.list_dataset_names(pattern, migrated=True)
+    dsnames += datasets.list_vsam_datasets(pattern, migrated=True)
+    return {dsname.strip() for dsname in dsnames}
+
+
+def unused_dataset_id(prefix: str) -> str:
+    """
+    Get next 5 digit id where no VSAM or non-VSAM dataset starts with `prefix` + id.
+
+    Catalog is searched once (including migrated datasets) for all datasets starting with `prefix`.
+    Names with further qualifiers after the id (ex: `prefix` + id + `".DDIR"`) are included.
+
+    Parameters
+    ----------
+    prefix : str
+        Dataset name prefix the id is appended to (ex: `"USER.PYIPCS.S"`).
+
+    Returns
+    -------
+    str
+        5 digit id
+    """
+    if not isinstance(prefix, str):
+        raise ArgumentTypeError("prefix", prefix, str)
+
+    # '*' only matches within the id qualifier so also list names with further qualifiers
+    dsnames = datasets_list_names(prefix + "*") | datasets_list_names(prefix + "*.**")
+
+    id_regex = re.compile(re.escape(prefix) + r"(\d{5})(?:\.|$)")
+    used_ids = set()
+    for dsname in dsnames:
+        id_match = id_regex.match(dsname)
+        if id_match:
+            used_ids.add(id_match.group(1))
+    if len(used_ids) >= 100000:
+        raise RuntimeError(f"No unused dataset ids remaining for prefix '{prefix}'")
+
+    dataset_id = f"{next(_dataset_id_counter) % 100000:05d}"
+    while dataset_id in used_ids:
+        dataset_id = f"{next(_dataset_id_counter) % 100000:05d}"
+    return dataset_id
+
+
+def datasets_create_many(creates: list[tuple[str, str]]) -> None:
+    """
+    Create multiple distinct datasets concurrently.
+
+    Parameters
+    ----------
+    creates : list[tuple[str,str]]
+        List of `(dsname, dataset_type)` tuples. Each `dsname` must be distinct.
+
+    Returns
+    -------
+    None
+    """
+    if not isinstance(creates, list):
+        raise ArgumentTypeError("creates", creates, list)
+    if not creates:
+        return
+
+    with ThreadPoolExecutor(max_workers=len(creates)) as executor:
+        futures = [
+            executor.submit(datasets.create, dsname, dataset_type=dataset_type)
+            for dsname, dataset_type in creates
+        ]
+        # Surface the first create exception, if any
+        for future in futures:
+            future.result()
+
+
+def datasets_write_many(writes: list[tuple[str, str]]) -> None:
+    """
+    Write content to multiple distinct datasets or PDSE members.
+
+    Writes to different datasets run concurrently.
+    Members of the same dataset are written one at a time,
+    since each member write allocates the whole dataset.
+
+    Parameters
+    ----------
+    writes : list[tuple[str,str]]
+        List of `(dsname, content)` tuples. Each `dsname` must be distinct.
+
+    Returns
+    -------
+    None
+    """
+    if not isinstance(writes, list):
+        raise ArgumentTypeError("writes", writes, list)
+    if not writes:
+        return
+
+    # Group writes by dataset name without the member name
+    writes_by_dataset = {}
+    for dsname, content in writes:
+        writes_by_dataset.setdefault(dsname.split("(", 1)[0], []).append((dsname, content))
+
+    def write_dataset(dataset_writes: list[tuple[str, str]]) -> None:
+        for dsname, content in dataset_writes:
+            datasets.write(dsname, content=content)
+
+    with ThreadPoolExecutor(max_workers=len(writes_by_dataset)) as executor:
+        futures = [
+            executor.submit(write_dataset, dataset_writes)
+            for dataset_writes in writes_by_dataset.values()
+        ]
+        # Surface the first write exception, if any
+        for future in futures:
+            future.result()
+
 # ==========================
 # Exposed Util Functions
 # ==========================
@@ -26,7 +26,9 @@ if os.path.exists(
     ) as settings_file:
         TEST_SETTINGS = json.load(settings_file)
 
-for pyipcs_test_setting in ["TEST_HLQ", "TEST_DIRECTORY", "TEST_ALLOCATIONS", "TEST_DUMPS"]:
+for pyipcs_test_setting in [
+    "TEST_HLQ", "TEST_DIRECTORY", "TEST_ALLOCATIONS", "TEST_DUMPS", "TEST_PARTIAL_READ"
+]:
     if pyipcs_test_setting not in TEST_SETTINGS:
         TEST_SETTINGS[pyipcs_test_setting] = None
 
@@ -72,6 +74,11 @@ else:
 
 TEST_DUMPS = TEST_SETTINGS["TEST_DUMPS"]
 
+# Read from TEST_DUMPS[0] whose 512 byte block is only partially in the dump
+# List of [hex_address, dec_offset, dec_length]. Could be None
+
+TEST_PARTIAL_READ = TEST_SETTINGS["TEST_PARTIAL_READ"]
+
 # =========================================
 # CHECK FOR NO LEFTOVER PYIPCS DATASETS
 # =========================================
@@ -164,6 +171,16 @@ def test_dump_list():
     return copy.deepcopy(TEST_DUMPS)
 
 
+@pytest.fixture
+def test_partial_read():
+    """
+    Corresponds to TEST_PARTIAL_READ
+    """
+    if not TEST_DUMPS or not TEST_PARTIAL_READ:
+        pytest.skip("No Test Partial Block Read Specified")
+    return tuple(TEST_PARTIAL_READ)
+
+
 # ==================================
 # Session Fixtures/Parameterization
 # ==================================
@@ -6,9 +6,18 @@ Test
 test_init_dump
     Test IpcsSession.init_dump
 
+test_init_dump_many
+    Test IpcsSession.init_dump_many
+
 test_set_dump
     Test IpcsSession.set_dump
 
+test_set_dump_after_dropdump
+    Test IpcsSession.set_dump fails for a dump dropped from its DDIR
+
+test_set_dump_after_external_dropdump
+    Test IpcsSession.set_dump fails for a dump dropped from its DDIR by another session
+
 """
 # pylint: disable=redefined-outer-name
 import pytest
@@ -102,6 +111,48 @@ def test_init_dump(open_session_default, test_dump_single, test_ddir, mock_statu
     open_session_default.close()
 
 
+def test_init_dump_many(open_session_default, test_dump_list, test_ddir):
+    """
+    Test IpcsSession.init_dump_many
+    """
+
+    # ======================
+    # Test empty list
+    # ======================
+
+    assert open_session_default.init_dump_many([]) == []
+
+    # ======================
+    # Test ddir param
+    # ======================
+
+    dumps = open_session_default.init_dump_many(test_dump_list, ddir=test_ddir)
+
+    assert [dump.dsname for dump in dumps] == test_dump_list
+
+    assert all(dump.ddir == test_ddir for dump in dumps)
+
+    assert open_session_default.ddir.dsname == test_ddir
+
+    assert open_session_default.ddir.defaults().data["dsname"] == test_dump_list[-1]
+
+    open_session_default.close()
+
+    # ======================
+    # Test argument types
+    # ======================
+
+    open_session_default.open()
+
+    with pytest.raises(TypeError):
+        open_session_default.init_dump_many(test_dump_list[0])
+
+    with pytest.raises(TypeError):
+        open_session_default.init_dump_many([1])
+
+    open_session_default.close()
+
+
 def test_set_dump(open_session_default, test_dump_single, test_ddir, mock_status_registers):
     """
     Test IpcsSession.set_dump
@@ -121,3 +172,46 @@ def test_set_dump(open_session_default, test_dump_single, test_ddir, mock_status
     assert open_session_default.ddir.defaults().data["dsname"] == test_dump_single
 
     assert Subcmd(open_session_default, "STATUS REGISTERS").output == mock_status_registers.output
+
+
+def test_set_dump_after_dropdump(open_session_default, test_dump_single, test_ddir):
+    """
+    Test IpcsSession.set_dump fails for a dump dropped from its DDIR
+    """
+
+    dump = open_session_default.init_dump(test_dump_single, ddir=test_ddir)
+
+    # Dump is a known source of the DDIR after initialization
+    open_session_default.set_dump(dump)
+
+    dropdump = Subcmd(open_session_default, f"DROPDUMP DSNAME('{test_dump_single}')")
+
+    assert dropdump.rc == 0
+
+    with pytest.raises(RuntimeError):
+        open_session_default.set_dump(dump)
+
+    open_session_default.close()
+
+
+def test_set_dump_after_external_dropdump(
+    open_session_default, test_dump_single, test_ddir
+):
+    """
+    Test IpcsSession.set_dump fails for a dump dropped from its DDIR by another session
+    """
+
+    dump = open_session_default.init_dump(test_dump_single, ddir=test_ddir)
+
+    open_session_default.set_dump(dump)
+
+    # Drop the dump outside of this session
+    with IpcsSession(allocations=TEST_ALLOCATIONS) as other_session:
+        other_session.ddir.use(test_ddir)
+        dropdump = Subcmd(other_session, f"DROPDUMP DSNAME('{test_dump_single}')")
+        assert dropdump.rc == 0
+
+    with pytest.raises(RuntimeError):
+        open_session_default.set_dump(dump)
+
+    open_session_default.close()
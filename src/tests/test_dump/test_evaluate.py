@@ -0,0 +1,132 @@
+"""
+Test suite for reading dump storage
+
+Tests
+-----
+test_evaluate_many
+    Test IpcsSession.evaluate_many matches reads made in separate IPCSEVAL runs
+
+test_evaluate_block_boundary
+    Test reads crossing a 512 byte block boundary
+
+test_evaluate_page_boundary
+    Test reads crossing a page boundary
+
+test_evaluate_address_forms
+    Test string address forms accepted by IPCS
+
+test_evaluate_partial_block
+    Test reads from a 512 byte block only partially included in the dump
+"""
+
+from pyipcs import Hex
+
+
+def split_read(session, hex_address, dec_offset, dec_length, split):
+    """
+    Read data in two IPCSEVAL runs split at `split` bytes and join as a string
+    """
+    first = session.evaluate(hex_address, dec_offset, split)
+    second = session.evaluate(hex_address, dec_offset + split, dec_length - split)
+    return first.to_str() + second.to_str()
+
+
+def test_evaluate_many(open_session_default, test_dump_single):
+    """
+    Test IpcsSession.evaluate_many matches reads made in separate IPCSEVAL runs
+    """
+    open_session_default.init_dump(test_dump_single)
+
+    # Overlapping, adjacent, and aliased reads of the PSA CVT pointer
+    requests = [
+        ("0", 16, 4),
+        (Hex("0"), 16, 8),
+        ("0", 20, 4),
+        ("10", 0, 4),
+        (0, 24, 4),
+        ("0", 24, 0),
+    ]
+
+    evaluated = open_session_default.evaluate_many(requests)
+
+    assert [data.to_str() for data in evaluated] == [
+        open_session_default.evaluate("0", 16, 4).to_str(),
+        split_read(open_session_default, "0", 16, 8, 4),
+        open_session_default.evaluate("0", 20, 4).to_str(),
+        open_session_default.evaluate("0", 16, 4).to_str(),
+        open_session_default.evaluate("0", 24, 4).to_str(),
+        "",
+    ]
+    assert open_session_default.evaluate_many([]) == []
+
+    open_session_default.close()
+
+
+def test_evaluate_block_boundary(open_session_default, test_dump_single):
+    """
+    Test reads crossing a 512 byte block boundary
+    """
+    open_session_default.init_dump(test_dump_single)
+
+    data = open_session_default.evaluate("0", 508, 8)
+
+    assert len(data.to_str()) == 16
+    assert data.to_str() == split_read(open_session_default, "0", 508, 8, 4)
+
+    # Read spanning three blocks
+    data = open_session_default.evaluate("0", 500, 600)
+
+    assert len(data.to_str()) == 1200
+    assert data.to_str() == split_read(open_session_default, "0", 500, 600, 12)
+
+    open_session_default.close()
+
+
+def test_evaluate_page_boundary(open_session_default, test_dump_single):
+    """
+    Test reads crossing a page boundary
+    """
+    open_session_default.init_dump(test_dump_single)
+
+    # The PSA spans the first two pages
+    data = open_session_default.evaluate("0", 4092, 8)
+
+    assert len(data.to_str()) == 16
+    assert data.to_str() == split_read(open_session_default, "0", 4092, 8, 4)
+
+    open_session_default.close()
+
+
+def test_evaluate_address_forms(open_session_default, test_dump_single):
+    """
+    Test string address forms accepted by IPCS
+    """
+    open_session_default.init_dump(test_dump_single)
+
+    expected = open_session_default.evaluate("10", 0, 4).to_str()
+
+    assert open_session_default.evaluate("0000_0010", 0, 4).to_str() == expected
+    assert open_session_default.evaluate("00000000_00000010", 0, 4).to_str() == expected
+    assert open_session_default.evaluate("10.", 0, 4).to_str() == expected
+
+    open_session_default.close()
+
+
+def test_evaluate_partial_block(open_session_default, test_dump_single, test_partial_read):
+    """
+    Test reads from a 512 byte block only partially included in the dump
+    """
+    open_session_default.init_dump(test_dump_single)
+
+    hex_address, dec_offset, dec_length = test_partial_read
+
+    data = open_session_default.evaluate(hex_address, dec_offset, dec_length)
+
+    assert len(data.to_str()) == dec_length * 2
+
+    if dec_length > 1:
+        assert data.to_str() == split_read(
+            open_session_default, hex_address, dec_offset, dec_length, dec_length // 2
+        )
+
+    open_session_default.close()
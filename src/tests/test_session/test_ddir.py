@@ -9,6 +9,9 @@ test_init_ddir
 test_create_tmp_ddir
     Checks temporary DDIR logic using DumpDirectory.create_tmp
 
+test_create_tmp_ddir_skips_used_id
+    Checks DumpDirectory.create_tmp does not reuse the id of an existing DDIR
+
 test_create_ddir
     Checks DDIR logic using DumpDirectory.create
 
@@ -19,9 +22,11 @@ test_ddir_defaults
     Test some DDIR defaults
 """
 
+import itertools
 import pytest
 from zoautil_py import datasets
 from pyipcs import Hex
+from pyipcs.util import zoautil_py_util
 
 @pytest.mark.parametrize(
     "test_session",
@@ -82,6 +87,27 @@ def test_create_tmp_ddir(test_session):
     assert not datasets.list_vsam_datasets(temp_ddir, migrated=True)
 
 
+def test_create_tmp_ddir_skips_used_id(open_session_default, monkeypatch):
+    """
+    Checks DumpDirectory.create_tmp does not reuse the id of an existing DDIR
+    """
+    # Seed a DDIR with the next id that would be handed out
+    seeded_ddir = f"{open_session_default.hlq_full}.D00000.DDIR"
+    open_session_default.ddir.create(seeded_ddir)
+    monkeypatch.setattr(zoautil_py_util, "_dataset_id_counter", itertools.count(0))
+
+    try:
+        assert datasets.list_vsam_datasets(seeded_ddir, migrated=True)
+
+        tmp_ddir = open_session_default.ddir.create_tmp()
+
+        assert tmp_ddir == f"{open_session_default.hlq_full}.D00001.DDIR"
+    finally:
+        open_session_default.ddir._delete(seeded_ddir)
+
+    open_session_default.close()
+
+
 @pytest.mark.parametrize(
     "test_session",
     ["open_session_default", "open_session_hlq"],
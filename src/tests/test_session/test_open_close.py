@@ -6,6 +6,9 @@ Tests
 test_temp_datasets
     Checks temporary datasets on session open and close
 
+test_context_manager
+    Checks session is opened and closed by a with statement
+
 test_cleanup
     Make sure no temporary datasets are left over after previous tests
 """
@@ -63,6 +66,36 @@ def test_temp_datasets(use_test_hlq, test_hlq):
     assert not datasets.list_dataset_names(session_hlq + ".*", migrated=True)
 
 
+def test_context_manager():
+    """
+    Checks session is opened and closed by a with statement
+    """
+    # ====================================
+    # Check open and close on normal exit
+    # ====================================
+
+    with IpcsSession() as test_session:
+        assert test_session.active
+        session_hlq = test_session.hlq_full
+
+    assert not test_session.active
+
+    assert not datasets.list_dataset_names(session_hlq + ".*", migrated=True)
+
+    # ==========================================
+    # Check close and re-raise on an exception
+    # ==========================================
+
+    with pytest.raises(ValueError):
+        with IpcsSession() as test_session:
+            session_hlq = test_session.hlq_full
+            raise ValueError
+
+    assert not test_session.active
+
+    assert not datasets.list_dataset_names(session_hlq + ".*", migrated=True)
+
+
 def test_cleanup(userid, test_hlq):
     """
     Make sure no temporary datasets are left over after previous tests